@@ -49,9 +49,8 @@ cdef class HitbtcActiveOrderTracker:
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         cdef:
             dict content = message.content
-            list content_keys = list(content.keys())
-            list bid_entries = []
-            list ask_entries = []
+            list bid_entries = content.get("bid", [])
+            list ask_entries = content.get("ask", [])
             str order_id
             str order_side
             str price_raw
@@ -60,11 +59,6 @@ cdef class HitbtcActiveOrderTracker:
             double timestamp = message.timestamp
             double amount = 0
 
-        if "bid" in content_keys:
-            bid_entries = content["bid"]
-        if "ask" in content_keys:
-            ask_entries = content["ask"]
-
         bids = s_empty_diff
         asks = s_empty_diff
 
@@ -5,11 +5,11 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 import aiohttp
-import pandas as pd
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 from .hitbtc_active_order_tracker import HitbtcActiveOrderTracker
@@ -22,6 +22,10 @@ from .hitbtc_websocket import HitbtcWebsocket
 class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
     _logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, str] = {}
+    # Reverse of _trading_pair_symbol_map, rebuilt whenever that map is replaced
+    _exchange_symbol_map: Dict[str, str] = {}
+    _exchange_symbol_map_source: Optional[Dict[str, str]] = None
+    _shared_client: Optional[aiohttp.ClientSession] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -31,8 +35,19 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     def __init__(self, trading_pairs: List[str] = None):
         super().__init__(trading_pairs)
-        self._trading_pairs: List[str] = trading_pairs
         self._snapshot_msg: Dict[str, any] = {}
+        # Exchange symbols of the tracked trading pairs (and the reverse map), resolved once on first subscription
+        self._symbols_by_trading_pair: Dict[str, str] = {}
+        self._trading_pairs_by_symbol: Dict[str, str] = {}
+
+    @classmethod
+    def _http_client(cls) -> aiohttp.ClientSession:
+        """
+        :returns Shared client session instance, kept alive across REST calls to reuse pooled connections
+        """
+        if cls._shared_client is None or cls._shared_client.closed:
+            cls._shared_client = aiohttp.ClientSession()
+        return cls._shared_client
 
     @classmethod
     async def init_trading_pair_symbols(cls, shared_session: Optional[aiohttp.ClientSession] = None):
@@ -42,7 +57,7 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
         symbols: List[Dict[str, Any]] = await api_call_with_retries(
             "GET",
             Constants.ENDPOINT["SYMBOL"],
-            shared_client=shared_session)
+            shared_client=shared_session or cls._http_client())
         cls._trading_pair_symbol_map = {
             symbol_data["id"]: (f"{translate_asset(symbol_data['baseCurrency'])}-"
                                 f"{translate_asset(symbol_data['quoteCurrency'])}")
@@ -60,25 +75,31 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, Decimal]:
         results = {}
         if len(trading_pairs) > 1:
-            tickers: List[Dict[Any]] = await api_call_with_retries("GET", Constants.ENDPOINT["TICKER"])
+            tickers: List[Dict[Any]] = await api_call_with_retries("GET", Constants.ENDPOINT["TICKER"],
+                                                                   shared_client=cls._http_client())
+            tickers_by_symbol: Dict[str, Dict[Any]] = {tic["symbol"]: tic for tic in tickers}
         for trading_pair in trading_pairs:
             ex_pair: str = await HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair(trading_pair)
             if len(trading_pairs) > 1:
-                ticker: Dict[Any] = list([tic for tic in tickers if tic['symbol'] == ex_pair])[0]
+                ticker: Dict[Any] = tickers_by_symbol[ex_pair]
             else:
                 url_endpoint = Constants.ENDPOINT["TICKER_SINGLE"].format(trading_pair=ex_pair)
-                ticker: Dict[Any] = await api_call_with_retries("GET", url_endpoint)
+                ticker: Dict[Any] = await api_call_with_retries("GET", url_endpoint, shared_client=cls._http_client())
             results[trading_pair]: Decimal = Decimal(str(ticker["last"]))
         return results
 
     @staticmethod
     async def exchange_symbol_associated_to_pair(trading_pair: str) -> str:
         symbol_map = await HitbtcAPIOrderBookDataSource.trading_pair_symbol_map()
-        symbols = [symbol for symbol, pair in symbol_map.items() if pair == trading_pair]
-
-        if symbols:
-            symbol = symbols[0]
-        else:
+        if HitbtcAPIOrderBookDataSource._exchange_symbol_map_source is not symbol_map:
+            exchange_symbol_map: Dict[str, str] = {}
+            for symbol, pair in symbol_map.items():
+                exchange_symbol_map.setdefault(pair, symbol)
+            HitbtcAPIOrderBookDataSource._exchange_symbol_map = exchange_symbol_map
+            HitbtcAPIOrderBookDataSource._exchange_symbol_map_source = symbol_map
+
+        symbol = HitbtcAPIOrderBookDataSource._exchange_symbol_map.get(trading_pair)
+        if symbol is None:
             raise ValueError(f"There is no symbol mapping for trading pair {trading_pair}")
 
         return symbol
@@ -100,8 +121,11 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         try:
             ex_pair = await HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair(trading_pair)
-            orderbook_response: Dict[Any] = await api_call_with_retries("GET", Constants.ENDPOINT["ORDER_BOOK"],
-                                                                        params={"limit": 150, "symbols": ex_pair})
+            orderbook_response: Dict[Any] = await api_call_with_retries(
+                "GET",
+                Constants.ENDPOINT["ORDER_BOOK"],
+                params={"limit": 150, "symbols": ex_pair},
+                shared_client=HitbtcAPIOrderBookDataSource._http_client())
             return orderbook_response[ex_pair]
         except HitbtcAPIError as e:
             err = e.error_payload.get('error', e.error_payload)
@@ -109,6 +133,19 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 f"Error fetching OrderBook for {trading_pair} at {Constants.EXCHANGE_NAME}. "
                 f"HTTP status is {e.error_payload['status']}. Error is {err.get('message', str(err))}.")
 
+    async def _tracked_pair_symbols(self) -> Dict[str, str]:
+        """
+        :returns Exchange symbol for each tracked trading pair
+        """
+        if not self._symbols_by_trading_pair:
+            symbols_by_trading_pair = {}
+            for trading_pair in self._trading_pairs:
+                symbol = await HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair(trading_pair)
+                symbols_by_trading_pair[trading_pair] = symbol
+            self._symbols_by_trading_pair = symbols_by_trading_pair
+            self._trading_pairs_by_symbol = {symbol: pair for pair, symbol in symbols_by_trading_pair.items()}
+        return self._symbols_by_trading_pair
+
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair)
         snapshot_timestamp: float = time.time()
@@ -131,8 +168,7 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 ws = HitbtcWebsocket()
                 await ws.connect()
 
-                for pair in self._trading_pairs:
-                    symbol = await HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair(pair)
+                for symbol in (await self._tracked_pair_symbols()).values():
                     await ws.subscribe(Constants.WS_SUB["TRADES"], symbol)
 
                 async for response in ws.on_message():
@@ -142,7 +178,9 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if trades_data is None or method != Constants.WS_METHODS['TRADES_UPDATE']:
                         continue
 
-                    pair: str = await self.trading_pair_associated_to_exchange_symbol(response["params"]["symbol"])
+                    symbol: str = trades_data["symbol"]
+                    pair: str = (self._trading_pairs_by_symbol.get(symbol)
+                                 or await self.trading_pair_associated_to_exchange_symbol(symbol))
 
                     for trade in trades_data["data"]:
                         trade: Dict[Any] = trade
@@ -175,8 +213,7 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     Constants.WS_METHODS['ORDERS_UPDATE'],
                 ]
 
-                for pair in self._trading_pairs:
-                    symbol = await HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair(pair)
+                for symbol in (await self._tracked_pair_symbols()).values():
                     await ws.subscribe(Constants.WS_SUB["ORDERS"], symbol)
 
                 async for response in ws.on_message():
@@ -187,7 +224,9 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         continue
 
                     timestamp: int = str_date_to_ts(order_book_data["timestamp"])
-                    pair: str = await self.trading_pair_associated_to_exchange_symbol(order_book_data["symbol"])
+                    symbol: str = order_book_data["symbol"]
+                    pair: str = (self._trading_pairs_by_symbol.get(symbol)
+                                 or await self.trading_pair_associated_to_exchange_symbol(symbol))
 
                     order_book_msg_cls = (HitbtcOrderBook.diff_message_from_exchange
                                           if method == Constants.WS_METHODS['ORDERS_UPDATE'] else
@@ -216,30 +255,10 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         while True:
             try:
-                for trading_pair in self._trading_pairs:
-                    try:
-                        snapshot: Dict[str, any] = await self.get_order_book_data(trading_pair)
-                        snapshot_timestamp: int = str_date_to_ts(snapshot["timestamp"])
-                        snapshot_msg: OrderBookMessage = HitbtcOrderBook.snapshot_message_from_exchange(
-                            snapshot,
-                            snapshot_timestamp,
-                            metadata={"trading_pair": trading_pair}
-                        )
-                        output.put_nowait(snapshot_msg)
-                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                        # Be careful not to go above API rate limits.
-                        await asyncio.sleep(5.0)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception:
-                        self.logger().network(
-                            "Unexpected error with WebSocket connection.", exc_info=True,
-                            app_warning_msg="Unexpected error with WebSocket connection. Retrying in 5 seconds. "
-                                            "Check network connection.")
-                        await asyncio.sleep(5.0)
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
+                await safe_gather(*[self._fetch_and_emit_snapshot(trading_pair, output)
+                                    for trading_pair in self._trading_pairs])
+                # Sleep until the top of the next UTC hour
+                delta: float = 3600 - (time.time() % 3600)
                 await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
@@ -247,6 +266,27 @@ class HitbtcAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 self.logger().error("Unexpected error.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    async def _fetch_and_emit_snapshot(self, trading_pair: str, output: asyncio.Queue):
+        """
+        Fetch the orderbook of a single trading pair and put its snapshot message in the output queue
+        """
+        try:
+            snapshot: Dict[str, any] = await self.get_order_book_data(trading_pair)
+            snapshot_timestamp: int = str_date_to_ts(snapshot["timestamp"])
+            snapshot_msg: OrderBookMessage = HitbtcOrderBook.snapshot_message_from_exchange(
+                snapshot,
+                snapshot_timestamp,
+                metadata={"trading_pair": trading_pair}
+            )
+            output.put_nowait(snapshot_msg)
+            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Unexpected error fetching order book snapshot for {trading_pair}.", exc_info=True,
+                app_warning_msg="Unexpected error fetching order book snapshot. Check network connection.")
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -4,6 +4,7 @@ import re
 from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
+import ujson
 from dateutil.parser import parse as dateparse
 from pydantic import Field, SecretStr
 
@@ -90,7 +91,7 @@ async def aiohttp_response_with_errors(request_coroutine):
         async with request_coroutine as response:
             http_status = response.status
             try:
-                parsed_response = await response.json()
+                parsed_response = await response.json(loads=ujson.loads)
             except Exception:
                 request_errors = True
                 try:
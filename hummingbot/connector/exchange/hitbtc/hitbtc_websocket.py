@@ -3,7 +3,7 @@ import asyncio
 import copy
 import logging
 import websockets
-import json
+import ujson
 from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants
 
 
@@ -51,7 +51,7 @@ class HitbtcWebsocket(RequestId):
             auth_params = self._auth.generate_auth_dict_ws(self.generate_request_id())
             await self._emit("login", auth_params, no_id=True)
             raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
-            json_msg = json.loads(raw_msg_str)
+            json_msg = ujson.loads(raw_msg_str)
             if json_msg.get("result") is not True:
                 err_msg = json_msg.get('error', {}).get('message')
                 raise HitbtcAPIError({"error": f"Failed to authenticate to websocket - {err_msg}."})
@@ -72,7 +72,7 @@ class HitbtcWebsocket(RequestId):
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = ujson.loads(raw_msg_str)
                         # HitBTC doesn't support ping or heartbeat messages.
                         # Can handle them here if that changes - use `safe_ensure_future`.
                         yield msg
@@ -98,7 +98,7 @@ class HitbtcWebsocket(RequestId):
             "params": copy.deepcopy(data),
         }
 
-        await self._client.send(json.dumps(payload))
+        await self._client.send(ujson.dumps(payload))
 
         return id
 
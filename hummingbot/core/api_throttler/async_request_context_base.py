@@ -3,7 +3,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
@@ -12,6 +12,32 @@ arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 
 
+def flush_task_logs(task_logs: List[TaskLog],
+                    task_logs_by_limit_id: Optional[Dict[str, List[TaskLog]]],
+                    safety_margin_pct: float):
+    """
+    Remove task logs that have passed rate limit periods
+    :param task_logs: Shared task logs
+    :param task_logs_by_limit_id: Optional shared index of the task logs by the limit_id of their RateLimit
+    :param safety_margin_pct: Percentage of the rate limit period a task log is kept after it has passed
+    """
+    now: Decimal = Decimal(str(time.time()))
+    active_task_logs: List[TaskLog] = []
+    for task in task_logs:
+        task_limit: RateLimit = task.rate_limit
+        elapsed: Decimal = now - Decimal(str(task.timestamp))
+        if elapsed <= Decimal(str(task_limit.time_interval * (1 + safety_margin_pct))):
+            active_task_logs.append(task)
+
+    if len(active_task_logs) != len(task_logs):
+        # The lists are shared between contexts, so they are updated in place
+        task_logs[:] = active_task_logs
+        if task_logs_by_limit_id is not None:
+            task_logs_by_limit_id.clear()
+            for task in active_task_logs:
+                task_logs_by_limit_id.setdefault(task.rate_limit.limit_id, []).append(task)
+
+
 class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
@@ -34,6 +60,8 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 task_logs_by_limit_id: Optional[Dict[str, List[TaskLog]]] = None,
+                 ensure_task_logs_flush: Optional[Callable[[], bool]] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +70,11 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param task_logs_by_limit_id: Optional shared index of the task logs by the limit_id of their RateLimit,
+            kept in sync with task_logs
+        :param ensure_task_logs_flush: Optional callable making sure the task logs are flushed in the background on
+            the running event loop. It returns False if they are not, in which case they are flushed on every
+            capacity check
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,18 +82,23 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._task_logs_by_limit_id: Optional[Dict[str, List[TaskLog]]] = task_logs_by_limit_id
+        self._ensure_task_logs_flush: Optional[Callable[[], bool]] = ensure_task_logs_flush
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        flush_task_logs(self._task_logs, self._task_logs_by_limit_id, self._safety_margin_pct)
+
+    def _task_logs_flushed_in_background(self) -> bool:
+        return self._ensure_task_logs_flush is not None and self._ensure_task_logs_flush()
+
+    def _log_task(self, task: TaskLog):
+        self._task_logs.append(task)
+        if self._task_logs_by_limit_id is not None:
+            self._task_logs_by_limit_id.setdefault(task.rate_limit.limit_id, []).append(task)
 
     @abstractmethod
     def within_capacity(self) -> bool:
@@ -69,7 +107,8 @@ class AsyncRequestContextBase(ABC):
     async def acquire(self):
         while True:
             async with self._lock:
-                self.flush()
+                if not self._task_logs_flushed_in_background():
+                    self.flush()
 
                 if self.within_capacity():
                     break
@@ -79,13 +118,14 @@ class AsyncRequestContextBase(ABC):
             # Each related limit is represented as it own individual TaskLog
 
             # Log the acquired rate limit into the tasks log
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
+            self._log_task(TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight))
 
             # Log its related limits into the tasks log as individual tasks
             for limit, weight in self._related_limits:
-                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+                self._log_task(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+
+            # The background flush stops once the task logs are empty, make sure it runs for the new entries
+            self._task_logs_flushed_in_background()
 
     async def __aenter__(self):
         await self.acquire()
@@ -1,13 +1,13 @@
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -26,14 +26,16 @@ class AsyncRequestContext(AsyncRequestContextBase):
             list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
                                                             self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
+            decimal_now: Decimal = Decimal(str(now))
             for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+                # Stop counting as soon as the used capacity leaves no room for this task
+                capacity_used: int = self._capacity_used(rate_limit.limit_id, decimal_now,
+                                                         max_capacity_used=rate_limit.limit - weight)
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                        # The warning is rate limited, so the full count is only computed here
+                        capacity_used = self._capacity_used(rate_limit.limit_id, decimal_now)
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
                               f"is {capacity_used} in the last " \
@@ -43,6 +45,27 @@ class AsyncRequestContext(AsyncRequestContextBase):
                     return False
         return True
 
+    def _capacity_used(self, limit_id: str, decimal_now: Decimal, max_capacity_used: Optional[int] = None) -> int:
+        """
+        Sums the weight of the logged tasks still within the time interval of the given limit.
+        :param limit_id: the limit_id to count the used capacity for
+        :param decimal_now: the current timestamp
+        :param max_capacity_used: if set, stops counting once the used capacity goes above this value
+        :return: the used capacity
+        """
+        capacity_used: int = 0
+        task_logs: List[TaskLog] = (self._task_logs
+                                    if self._task_logs_by_limit_id is None
+                                    else self._task_logs_by_limit_id.get(limit_id, []))
+        for task in task_logs:
+            task_limit: RateLimit = task.rate_limit
+            if (limit_id == task_limit.limit_id and
+                    decimal_now - Decimal(str(task.timestamp)) - Decimal(str(task_limit.time_interval * self._safety_margin_pct)) <= task_limit.time_interval):
+                capacity_used += task.weight
+                if max_capacity_used is not None and capacity_used > max_capacity_used:
+                    break
+        return capacity_used
+
     def _time(self):
         return time.time()
 
@@ -69,6 +92,8 @@ class AsyncThrottler(AsyncThrottlerBase):
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
         return AsyncRequestContext(
             task_logs=self._task_logs,
+            task_logs_by_limit_id=self._task_logs_by_limit_id,
+            ensure_task_logs_flush=self._ensure_task_logs_flush,
             rate_limit=rate_limit,
             related_limits=related_rate_limits,
             lock=self._lock,
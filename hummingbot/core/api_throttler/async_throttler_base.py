@@ -2,14 +2,18 @@ import asyncio
 import copy
 import logging
 import math
+import weakref
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
-from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase, flush_task_logs
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.logger import HummingbotLogger
 
+TASK_LOGS_FLUSH_INTERVAL = 1.0
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -48,6 +52,8 @@ class AsyncThrottlerBase(ABC):
 
         # List of TaskLog used to determine the API requests within a set time window.
         self._task_logs: List[TaskLog] = []
+        # The same TaskLogs indexed by the limit_id of their RateLimit, so capacity checks only visit relevant logs.
+        self._task_logs_by_limit_id: Dict[str, List[TaskLog]] = {}
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
@@ -56,6 +62,10 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Background task removing expired TaskLogs, started by the request contexts on the running event loop
+        self._task_logs_flush_task: Optional[asyncio.Task] = None
+        self._task_logs_flush_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -85,6 +95,39 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def _ensure_task_logs_flush(self) -> bool:
+        """
+        Starts flushing expired task logs in the background on the running event loop, if it is not running there yet.
+        A flush task left on a previous event loop (stopped or closed) is replaced.
+        :return: True if the task logs are flushed in the background, False if there is no running event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if (self._task_logs_flush_task is None
+                or self._task_logs_flush_task.done()
+                or self._task_logs_flush_loop is not loop):
+            self._task_logs_flush_task = safe_ensure_future(self._flush_task_logs_loop(weakref.ref(self)))
+            self._task_logs_flush_loop = loop
+        return True
+
+    @staticmethod
+    async def _flush_task_logs_loop(throttler_ref: "weakref.ReferenceType[AsyncThrottlerBase]"):
+        # Only holds the throttler weakly between flushes, so the task does not keep an unused throttler alive, and
+        # stops once it is collected. Also stops once all task logs have expired. Request contexts start it again after
+        # logging new tasks, under the same lock, so logs are never left without a running flush task.
+        while True:
+            await asyncio.sleep(TASK_LOGS_FLUSH_INTERVAL)
+            throttler: Optional[AsyncThrottlerBase] = throttler_ref()
+            if throttler is None:
+                break
+            async with throttler._lock:
+                flush_task_logs(throttler._task_logs, throttler._task_logs_by_limit_id, throttler._safety_margin_pct)
+                if len(throttler._task_logs) == 0:
+                    break
+            throttler = None
+
     @abstractmethod
     def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -49,7 +49,7 @@ class RateLimit:
                f"weight: {self.weight}, linked_limits: {self.linked_limits}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskLog:
     timestamp: float
     rate_limit: RateLimit
@@ -1,5 +1,7 @@
 import asyncio
 import json
+import re
+from decimal import Decimal
 from typing import Awaitable
 
 from unittest import TestCase
@@ -8,12 +10,17 @@ from aioresponses import aioresponses
 
 from hummingbot.connector.exchange.hitbtc.hitbtc_api_order_book_data_source import HitbtcAPIOrderBookDataSource
 from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants as CONSTANTS
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
 
 
 class HitbtcAPIOrderBookDataSourceTests(TestCase):
 
     def tearDown(self) -> None:
         HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {}
+        shared_client = HitbtcAPIOrderBookDataSource._shared_client
+        if shared_client is not None and not shared_client.closed:
+            self.async_run_with_timeout(shared_client.close())
+        HitbtcAPIOrderBookDataSource._shared_client = None
         super().tearDown()
 
     def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
@@ -67,6 +74,15 @@ class HitbtcAPIOrderBookDataSourceTests(TestCase):
             HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair("BTC-USDT"))
         self.assertEqual("BTCUSDT", symbol)
 
+    def test_exchange_symbol_associated_to_pair_after_symbol_map_is_replaced(self):
+        HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {"BTCUSDT": "BTC-USDT"}
+        self.async_run_with_timeout(HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair("BTC-USDT"))
+
+        HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {"BTCUSD": "BTC-USDT", "ETHUSDT": "ETH-USDT"}
+        symbol = self.async_run_with_timeout(
+            HitbtcAPIOrderBookDataSource.exchange_symbol_associated_to_pair("BTC-USDT"))
+        self.assertEqual("BTCUSD", symbol)
+
     def test_exchange_symbol_associated_to_pair_raises_error_when_pair_not_found(self):
         HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"}
         with self.assertRaises(ValueError) as exception:
@@ -79,3 +95,87 @@ class HitbtcAPIOrderBookDataSourceTests(TestCase):
         symbol = self.async_run_with_timeout(
             HitbtcAPIOrderBookDataSource.trading_pair_associated_to_exchange_symbol("BTCUSDT"))
         self.assertEqual("BTC-USDT", symbol)
+
+    def test_tracked_pair_symbols(self):
+        HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"}
+        data_source = HitbtcAPIOrderBookDataSource(["BTC-USDT"])
+
+        symbols = self.async_run_with_timeout(data_source._tracked_pair_symbols())
+
+        self.assertEqual({"BTC-USDT": "BTCUSDT"}, symbols)
+        self.assertEqual({"BTCUSDT": "BTC-USDT"}, data_source._trading_pairs_by_symbol)
+
+    @aioresponses()
+    def test_get_last_traded_prices_for_multiple_pairs(self, mock_api):
+        HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"}
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ENDPOINT['TICKER']}"
+        resp = [
+            {"symbol": "LTCUSDT", "last": "70.1"},
+            {"symbol": "ETHUSDT", "last": "1800.5"},
+            {"symbol": "BTCUSDT", "last": "30000.25"},
+        ]
+        mock_api.get(url, body=json.dumps(resp))
+
+        prices = self.async_run_with_timeout(
+            HitbtcAPIOrderBookDataSource.get_last_traded_prices(["BTC-USDT", "ETH-USDT"]))
+
+        self.assertEqual(Decimal("30000.25"), prices["BTC-USDT"])
+        self.assertEqual(Decimal("1800.5"), prices["ETH-USDT"])
+
+    @aioresponses()
+    def test_rest_calls_reuse_shared_client(self, mock_api):
+        self._configure_order_book_response(mock_api)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ENDPOINT['TICKER_SINGLE'].format(trading_pair='BTCUSDT')}"
+        mock_api.get(url, body=json.dumps({"symbol": "BTCUSDT", "last": "30000.25"}))
+
+        self.async_run_with_timeout(HitbtcAPIOrderBookDataSource.get_last_traded_prices(["BTC-USDT"]))
+        first_client = HitbtcAPIOrderBookDataSource._shared_client
+        self.async_run_with_timeout(HitbtcAPIOrderBookDataSource.get_order_book_data("BTC-USDT"))
+        second_client = HitbtcAPIOrderBookDataSource._shared_client
+
+        self.assertIsNotNone(first_client)
+        self.assertIs(first_client, second_client)
+        self.assertFalse(second_client.closed)
+
+    def _configure_order_book_response(self, mock_api):
+        HitbtcAPIOrderBookDataSource._trading_pair_symbol_map = {"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"}
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ENDPOINT['ORDER_BOOK']}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = {
+            "BTCUSDT": {
+                "symbol": "BTCUSDT",
+                "timestamp": "2021-04-09T10:34:00.000Z",
+                "ask": [{"price": "30001.00", "size": "0.5"}],
+                "bid": [{"price": "30000.00", "size": "1.5"}],
+            }
+        }
+        mock_api.get(regex_url, body=json.dumps(resp))
+
+    @aioresponses()
+    def test_fetch_and_emit_snapshot(self, mock_api):
+        self._configure_order_book_response(mock_api)
+        data_source = HitbtcAPIOrderBookDataSource(["BTC-USDT"])
+        output = asyncio.Queue()
+
+        self.async_run_with_timeout(data_source._fetch_and_emit_snapshot("BTC-USDT", output))
+
+        self.assertEqual(1, output.qsize())
+        snapshot_msg = output.get_nowait()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot_msg.type)
+        self.assertEqual("BTC-USDT", snapshot_msg.trading_pair)
+
+    @aioresponses()
+    def test_get_new_order_book(self, mock_api):
+        self._configure_order_book_response(mock_api)
+        data_source = HitbtcAPIOrderBookDataSource(["BTC-USDT"])
+
+        order_book = self.async_run_with_timeout(data_source.get_new_order_book("BTC-USDT"))
+
+        bids = list(order_book.bid_entries())
+        asks = list(order_book.ask_entries())
+        self.assertEqual(1, len(bids))
+        self.assertEqual(30000.0, bids[0].price)
+        self.assertEqual(1.5, bids[0].amount)
+        self.assertEqual(1, len(asks))
+        self.assertEqual(30001.0, asks[0].price)
+        self.assertEqual(0.5, asks[0].amount)
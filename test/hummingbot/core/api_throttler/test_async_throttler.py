@@ -1,9 +1,11 @@
 import asyncio
+import gc
 import logging
 import math
 import sys
 import time
 import unittest
+import weakref
 from decimal import Decimal
 from typing import Dict, List
 from unittest.mock import patch
@@ -50,6 +52,13 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
         self.client_config_map = ClientConfigAdapter(ClientConfigMap())
 
+    def tearDown(self) -> None:
+        flush_task = self.throttler._task_logs_flush_task
+        if flush_task is not None and not flush_task.done():
+            flush_task.cancel()
+            self.ev_loop.run_until_complete(asyncio.gather(flush_task, return_exceptions=True))
+        super().tearDown()
+
     async def execute_requests(self, no_request: int, limit_id: str, throttler: AsyncThrottler):
         for _ in range(no_request):
             async with throttler.execute_task(limit_id=limit_id):
@@ -189,6 +198,24 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         self.assertTrue(context.within_capacity())
 
+    @patch("hummingbot.core.api_throttler.async_request_context_base.AsyncRequestContextBase._last_max_cap_warning_ts",
+           0.0)
+    def test_within_capacity_warning_reports_full_used_capacity(self):
+        rate_limit = self.throttler._id_to_limit_map[TEST_POOL_ID]
+        for _ in range(3):
+            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=[],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+
+        with patch.object(AsyncRequestContext, "logger") as logger_mock:
+            self.assertFalse(context.within_capacity())
+
+        logger_mock.return_value.notify.assert_called_once()
+        self.assertIn("Limits used is 3 in the last", logger_mock.return_value.notify.call_args[0][0])
+
     def test_within_capacity_returns_true(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
@@ -211,6 +238,119 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         # We acquire()'d just one rate_limit, task log should have only one entry
         self.assertEqual(1, len(self.throttler._task_logs))
 
+    def test_acquire_indexes_task_logs_by_limit_id(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(1, len(self.throttler._task_logs_by_limit_id[TEST_PATH_URL]))
+        self.assertEqual(1, len(self.throttler._task_logs_by_limit_id[TEST_POOL_ID]))
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_flush_removes_elapsed_tasks_from_limit_id_index(self):
+        rate_limit = self.rate_limits[0]
+        elapsed_task = TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight)
+        active_task = TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
+        self.throttler._task_logs.extend([elapsed_task, active_task])
+        self.throttler._task_logs_by_limit_id[rate_limit.limit_id] = [elapsed_task, active_task]
+
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        context.flush()
+
+        self.assertEqual([active_task], self.throttler._task_logs)
+        self.assertEqual({rate_limit.limit_id: [active_task]}, self.throttler._task_logs_by_limit_id)
+
+    def test_execute_task_within_running_loop_flushes_task_logs_in_background(self):
+        async def execute_task():
+            async with self.throttler.execute_task(limit_id=TEST_POOL_ID):
+                pass
+
+        self.ev_loop.run_until_complete(execute_task())
+
+        self.assertIsNotNone(self.throttler._task_logs_flush_task)
+        self.assertFalse(self.throttler._task_logs_flush_task.done())
+
+    def test_ensure_task_logs_flush_without_running_loop_returns_false(self):
+        self.assertFalse(self.throttler._ensure_task_logs_flush())
+        self.assertIsNone(self.throttler._task_logs_flush_task)
+
+    def test_acquire_restarts_background_flush_after_it_stopped(self):
+        async def execute_task():
+            async with self.throttler.execute_task(limit_id=TEST_POOL_ID):
+                pass
+
+        self.ev_loop.run_until_complete(execute_task())
+        first_flush_task = self.throttler._task_logs_flush_task
+        first_flush_task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(first_flush_task, return_exceptions=True))
+        self.assertTrue(first_flush_task.done())
+
+        self.throttler._task_logs.clear()
+        self.throttler._task_logs_by_limit_id.clear()
+        self.ev_loop.run_until_complete(execute_task())
+
+        self.assertIsNot(first_flush_task, self.throttler._task_logs_flush_task)
+        self.assertFalse(self.throttler._task_logs_flush_task.done())
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.TASK_LOGS_FLUSH_INTERVAL", 0.05)
+    def test_background_flush_restarts_on_new_event_loop(self):
+        rate_limit = RateLimit(limit_id="short_limit", limit=100, time_interval=0.1)
+        throttler = AsyncThrottler(rate_limits=[rate_limit])
+
+        async def execute_tasks(no_tasks: int):
+            for _ in range(no_tasks):
+                async with throttler.execute_task(limit_id=rate_limit.limit_id):
+                    pass
+
+        first_loop = asyncio.new_event_loop()
+        first_loop.run_until_complete(execute_tasks(1))
+        first_flush_task = throttler._task_logs_flush_task
+        first_flush_task.cancel()
+        first_loop.run_until_complete(asyncio.gather(first_flush_task, return_exceptions=True))
+        first_loop.close()
+
+        second_loop = asyncio.new_event_loop()
+        try:
+            second_loop.run_until_complete(execute_tasks(7))
+            self.assertIsNot(first_flush_task, throttler._task_logs_flush_task)
+            self.assertIs(second_loop, throttler._task_logs_flush_loop)
+
+            second_loop.run_until_complete(asyncio.sleep(0.5))
+            self.assertEqual(0, len(throttler._task_logs))
+            self.assertEqual({}, throttler._task_logs_by_limit_id)
+        finally:
+            second_loop.close()
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.TASK_LOGS_FLUSH_INTERVAL", 0.0)
+    def test_flush_task_logs_loop_stops_once_all_task_logs_expired(self):
+        rate_limit = self.rate_limits[0]
+        elapsed_task = TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight)
+        self.throttler._task_logs.append(elapsed_task)
+        self.throttler._task_logs_by_limit_id[rate_limit.limit_id] = [elapsed_task]
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.throttler._flush_task_logs_loop(weakref.ref(self.throttler)), 1.0))
+
+        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual({}, self.throttler._task_logs_by_limit_id)
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.TASK_LOGS_FLUSH_INTERVAL", 0.05)
+    def test_background_flush_does_not_keep_throttler_alive(self):
+        async def execute_task(throttler: AsyncThrottler):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                pass
+
+        throttler = AsyncThrottler(rate_limits=self.rate_limits)
+        self.ev_loop.run_until_complete(execute_task(throttler))
+        flush_task = throttler._task_logs_flush_task
+        throttler_ref = weakref.ref(throttler)
+
+        del throttler
+        gc.collect()
+
+        self.assertIsNone(throttler_ref())
+        self.ev_loop.run_until_complete(asyncio.wait_for(flush_task, 1.0))
+        self.assertTrue(flush_task.done())
+
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
         self.throttler._task_logs.append(